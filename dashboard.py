@@ -1,66 +1,75 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import plotly.express as px
-import fastf1
+import plotly.graph_objects as go
 from fastf1 import plotting
-import os
 from datetime import datetime
 
+from f1_cache import (
+    driver_list,
+    get_event_names,
+    lap_time_histogram,
+    load_fastf1_session,
+    slim_laps,
+    telemetry_of,
+)
+
 # Setup
 st.set_page_config(page_title="F1 InsightX", layout="wide")
 plotting.setup_mpl()
 
-# Ensure cache folder exists
-os.makedirs("ff1cache", exist_ok=True)
-fastf1.Cache.enable_cache("ff1cache")
-
 # Sidebar: Session Selection
 st.sidebar.title("Session Selection")
 year = st.sidebar.selectbox("Season", list(range(2018, datetime.now().year + 1)), index=datetime.now().year - 2018)
 
-schedule = fastf1.get_event_schedule(year)
-event_names = schedule.EventName.tolist()
+event_names = get_event_names(year)
 event_choice = st.sidebar.selectbox("Grand Prix", event_names)
 session_type = st.sidebar.selectbox("Session", ["FP1", "FP2", "FP3", "Qualifying", "Sprint", "Race"], index=3)
 
 # Load Session
 try:
-    session = fastf1.get_session(year, event_choice, session_type)
-    session.load()
+    with st.spinner("Loading session..."):
+        session = load_fastf1_session(year, event_choice, session_type)
 except Exception as e:
     st.error(f"Could not load session: {e}")
     st.stop()
 
+session_key = (year, event_choice, session_type)
+
 st.title(f"F1 InsightX — {year} {event_choice} {session_type}")
 
 # Lap Data
-laps = session.laps
-if laps.empty:
+if session.laps.empty:
     st.warning("No laps available.")
     st.stop()
 
 st.subheader("Lap Times")
-st.dataframe(laps[["Driver", "LapNumber", "LapTime", "Compound"]].reset_index(drop=True), use_container_width=True)
+summary = slim_laps(*session_key)
+st.dataframe(summary, use_container_width=True)
 
-fig = px.histogram(laps, x="LapTime", nbins=40, title="Lap Time Distribution")
+# Bin lap times server-side so only the bin counts are sent to the browser
+counts, edges = lap_time_histogram(*session_key)
+fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+fig.update_layout(title="Lap Time Distribution", xaxis_title="LapTime (s)", yaxis_title="count", bargap=0)
 st.plotly_chart(fig, use_container_width=True)
 
 # Tyre Usage
-if "Compound" in laps.columns:
+if "Compound" in summary.columns:
     st.subheader("Tyre Strategy")
-    tyre_counts = laps["Compound"].value_counts().reset_index()
+    tyre_counts = summary["Compound"].value_counts().reset_index()
     tyre_counts.columns = ["Compound", "Count"]
-    st.plotly_chart(px.pie(tyre_counts, names="Compound", values="Count", title="Tyre Usage"), use_container_width=True)
+    st.bar_chart(tyre_counts.set_index("Compound")["Count"])
 
 # Telemetry 
 st.subheader("Telemetry (Fastest Lap)")
-drivers = sorted(laps.Driver.unique())
+drivers = driver_list(*session_key)
 driver_choice = st.selectbox("Choose Driver", drivers)
 
 try:
-    fastest = laps.pick_driver(driver_choice).pick_fastest()
-    tel = fastest.get_telemetry()
+    tel = telemetry_of(*session_key, driver_choice)
 
     fig, ax = plt.subplots(figsize=(10, 4))
     ax.plot(tel.Distance, tel.Speed, label="Speed")
@@ -68,8 +77,9 @@ try:
     ax.set_ylabel("Speed (kph)")
     ax.legend()
     st.pyplot(fig)
+    plt.close(fig)
 
-    st.plotly_chart(px.scatter(tel, x="X", y="Y", color="Speed", title="Track Map"), use_container_width=True)
+    st.plotly_chart(px.scatter(tel, x="X", y="Y", color="Speed", render_mode="webgl", title="Track Map"), use_container_width=True)
 
 except Exception as e:
     st.error(f"Could not load telemetry: {e}")
@@ -0,0 +1,73 @@
+"""Cached FastF1 loaders shared across dashboard reruns."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import fastf1
+import os
+
+# Ensure cache folder exists
+os.makedirs("ff1cache", exist_ok=True)
+fastf1.Cache.enable_cache("ff1cache")
+
+SUMMARY_COLS = ["Driver", "LapNumber", "LapTime", "Compound"]
+# Sessions held by load_fastf1_session, the only cache that keeps live Session
+# objects (the cache_data helpers store plain pickled frames); each one with
+# telemetry is hundreds of MB, evicted sessions are reloaded from ff1cache on disk
+MAX_SESSIONS = 2
+TEL_COLS = ["Distance", "Speed", "X", "Y"]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_event_names(year):
+    """Grand Prix names for a season, refreshed at most once an hour."""
+    return fastf1.get_event_schedule(year).EventName.tolist()
+
+@st.cache_resource(max_entries=MAX_SESSIONS, show_spinner=False)
+def load_fastf1_session(year, event, session_type):
+    """Load a FastF1 session once and share the same object across reruns."""
+    session = fastf1.get_session(year, event, session_type)
+    session.load()
+    return session
+
+@st.cache_data(show_spinner=False)
+def slim_laps(year, event, session_type):
+    """Column-pruned copy of a session's laps, built once per session."""
+    df = load_fastf1_session(year, event, session_type).laps
+    cols = [c for c in SUMMARY_COLS if c in df.columns]
+    out = pd.DataFrame(df[cols]).reset_index(drop=True)
+    for c in ("Driver", "Compound"):
+        if c in out:
+            out[c] = out[c].astype("category")
+    return out
+
+@st.cache_data(show_spinner=False)
+def driver_list(year, event, session_type):
+    """Sorted driver codes that set laps in a session."""
+    summary = slim_laps(year, event, session_type)
+    return sorted(summary["Driver"].dropna().unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def lap_time_histogram(year, event, session_type, bins=40):
+    """Bin counts and edges of a session's lap times in seconds."""
+    sec = slim_laps(year, event, session_type)["LapTime"].dt.total_seconds().to_numpy()
+    return np.histogram(sec[~np.isnan(sec)], bins=bins)
+
+def load_tel(lap, n=500):
+    """Fetch a lap's telemetry and downsample it to at most n evenly spaced samples."""
+    t = lap.get_telemetry()
+    if len(t) <= n:
+        return t.reset_index(drop=True)
+    idx = np.linspace(0, len(t) - 1, n).astype(int)
+    return t.iloc[idx].reset_index(drop=True)
+
+def fastest_lap(year, event, session_type, driver):
+    """A driver's fastest lap in a session."""
+    return load_fastf1_session(year, event, session_type).laps.pick_driver(driver).pick_fastest()
+
+@st.cache_data(show_spinner=False)
+def telemetry_of(year, event, session_type, driver):
+    """Downsampled telemetry of a driver's fastest lap, as a plain DataFrame.
+
+    Only the plotted columns are kept, so the cached frame holds no reference to the Session.
+    """
+    tel = load_tel(fastest_lap(year, event, session_type, driver))
+    return pd.DataFrame(tel[TEL_COLS])